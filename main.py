@@ -1,6 +1,13 @@
 import os
 import json
+import math
+import time
+import functools
+import queue
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 
@@ -9,6 +16,10 @@ DATA_DIR = "data"
 STATE_FILE = os.path.join(DATA_DIR, "tabs_state.json")
 QUOTES_FILE = os.path.join(DATA_DIR, "quotes.txt")
 
+_HAIKU_WORDS = (5, 7, 5)
+# Final-minute timer labels, indexed by remaining seconds.
+_LAST_MINUTE_LABELS = [f"00:{s:02d}" for s in range(60)]
+
 
 class NoteText(tk.Text):
     """Text widget with optional Hemingway mode."""
@@ -17,9 +28,16 @@ class NoteText(tk.Text):
         super().__init__(master, wrap=tk.WORD, undo=True, **kwargs)
         self.filename: str | None = None
         self.hemingway = False
+        self._key_binding: str | None = None
 
     def enable_hemingway(self, enable: bool) -> None:
+        # <Key> is only bound while the mode is on, so normal typing never calls into Python.
         self.hemingway = enable
+        if enable and self._key_binding is None:
+            self._key_binding = self.bind("<Key>", self._block_keys, add=True)
+        elif not enable and self._key_binding is not None:
+            self.unbind("<Key>", self._key_binding)
+            self._key_binding = None
 
     def _block_keys(self, event: tk.Event) -> str:
         if self.hemingway and event.keysym in {"BackSpace", "Delete", "Left"}:
@@ -46,85 +64,169 @@ class GUINotator(tk.Tk):
 
         self.timer_id: str | None = None
         self.remaining = 0
+        self._deadline = 0.0
         self.hemingway = False
-        self.quotes = self._load_quotes()
+        self._save_queue: queue.Queue = queue.Queue()
+        self._save_results: queue.Queue = queue.Queue()
+        self._saver: threading.Thread | None = None
+        self._pending_saves = 0
+        self._texts: dict[str, NoteText] = {}
+        self._dirty_tabs: set[str] = set()
+        self._quote_win: tk.Toplevel | None = None
+        self._quote_label: tk.Label | None = None
 
         self._bind_shortcuts()
         self._load_tabs()
 
     # ---------- Utility methods ----------
+    _SHORTCUTS = {
+        "n": "new_tab",
+        "o": "open_file",
+        "s": "save",
+        "S": "save_as",
+        "w": "close_tab",
+        "l": "show_quote",
+        "t": "set_timer",
+        "r": "reset_timer",
+        "g": "toggle_hemingway",
+        "Delete": "delete_file",
+    }
+
     def _bind_shortcuts(self) -> None:
-        self.bind("<Control-n>", lambda e: self.new_tab())
-        self.bind("<Control-o>", lambda e: self.open_file())
-        self.bind("<Control-s>", lambda e: self.save())
-        self.bind("<Control-S>", lambda e: self.save_as())
-        self.bind("<Control-w>", lambda e: self.close_tab())
-        self.bind("<Control-l>", lambda e: self.show_quote())
-        self.bind("<Control-t>", lambda e: self.set_timer())
-        self.bind("<Control-r>", lambda e: self.reset_timer())
-        self.bind("<Control-g>", lambda e: self.toggle_hemingway())
-        self.bind("<Control-Delete>", lambda e: self.delete_file())
-
-    def _load_quotes(self) -> list[str]:
-        if os.path.exists(QUOTES_FILE):
-            with open(QUOTES_FILE, "r", encoding="utf-8") as f:
-                return [line.strip() for line in f if line.strip()]
-        return []
+        for key in self._SHORTCUTS:
+            self.bind(f"<Control-{key}>", self._on_shortcut)
+
+    def _on_shortcut(self, event: tk.Event) -> None:
+        getattr(self, self._SHORTCUTS[event.keysym])()
+
+    @functools.cached_property
+    def quotes(self) -> list[str]:
+        """Quotes from ``QUOTES_FILE``, read on first use."""
+        path = Path(QUOTES_FILE)
+        if not path.exists():
+            return []
+        lines = path.read_text(encoding="utf-8").splitlines()
+        return [line for line in map(str.strip, lines) if line]
 
     def _current_text(self) -> NoteText:
-        frame = self.nametowidget(self.notebook.select())
-        return frame.winfo_children()[0]
+        return self._texts[self.notebook.select()]
 
     # ---------- Tab management ----------
     def new_tab(self, filename: str | None = None, content: str | None = None) -> None:
         frame = tk.Frame(self.notebook)
         text = NoteText(frame)
-        text.pack(fill=tk.BOTH, expand=True)
-        text.bind("<Key>", text._block_keys, add=True)
-        text.bind("<<Modified>>", lambda e, t=text: self._on_modified(t))
         if filename:
             text.filename = filename
         if content:
+            # Loading a file is not an undoable edit; keep it off the undo stack.
+            text.configure(undo=False)
             text.insert("1.0", content)
+            text.edit_reset()
+            text.configure(undo=True)
+            text.edit_modified(False)
+        text.pack(fill=tk.BOTH, expand=True)
+        if self.hemingway:
+            text.enable_hemingway(True)
+        tab_id = str(frame)
+        text.bind("<<Modified>>", lambda e: self._on_modified(tab_id))
         title = filename or "Untitled"
         self.notebook.add(frame, text=title)
+        self._texts[tab_id] = text
         self.notebook.select(frame)
 
     def close_tab(self) -> None:
         current = self.notebook.select()
         if current:
             self.notebook.forget(current)
+            del self._texts[current]
+            self._dirty_tabs.discard(current)
 
-    def _on_modified(self, text: NoteText) -> None:
-        idx = self.notebook.index(self.notebook.select())
-        label = self.notebook.tab(idx, "text")
-        if text.edit_modified():
-            if not label.endswith("*"):
-                self.notebook.tab(idx, text=label + "*")
-        else:
-            self.notebook.tab(idx, text=label.rstrip("*"))
-        text.edit_modified(False)
+    def _on_modified(self, tab_id: str) -> None:
+        text = self._texts.get(tab_id)
+        if text is None:
+            return
+        dirty = text.edit_modified()
+        if dirty != (tab_id in self._dirty_tabs):
+            label = self.notebook.tab(tab_id, "text")
+            if dirty:
+                self._dirty_tabs.add(tab_id)
+                if not label.endswith("*"):
+                    self.notebook.tab(tab_id, text=label + "*")
+            else:
+                self._dirty_tabs.discard(tab_id)
+                self.notebook.tab(tab_id, text=label.rstrip("*"))
 
     # ---------- File operations ----------
     def save(self) -> None:
-        text = self._current_text()
+        tab_id = self.notebook.select()
+        text = self._texts[tab_id]
         if not text.filename:
             self.save_as()
             return
+        if not text.edit_modified():
+            self.status.config(text=f"Unchanged {text.filename}")
+            return
+        self._save_text(tab_id)
+
+    def _save_text(self, tab_id: str) -> None:
+        text = self._texts[tab_id]
         path = os.path.join(DATA_DIR, text.filename)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(text.get("1.0", tk.END))
-        self.status.config(text=f"Saved {text.filename}")
-        self._update_tab_title(text)
+        payload = text.get("1.0", tk.END)
+        if self._saver is None:
+            self._saver = threading.Thread(target=self._save_worker, daemon=True)
+            self._saver.start()
+        self._save_queue.put((tab_id, text.filename, path, payload))
+        if not self._pending_saves:
+            self.after(50, self._poll_saves)
+        self._pending_saves += 1
+        # Edits made from here on set the flag again; a failed write restores it.
+        self._update_tab_title(tab_id)
         text.edit_modified(False)
 
+    def _save_worker(self) -> None:
+        """Write queued notes in order, off the Tk thread."""
+        while (job := self._save_queue.get()) is not None:
+            tab_id, fname, path, payload = job
+            error = None
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+            except OSError as exc:
+                error = exc
+            self._save_results.put((tab_id, fname, error))
+
+    def _poll_saves(self) -> None:
+        self._drain_saves()
+        if self._pending_saves:
+            self.after(50, self._poll_saves)
+
+    def _drain_saves(self) -> bool:
+        """Apply finished writes on the Tk thread; return False if any failed."""
+        ok = True
+        while True:
+            try:
+                tab_id, fname, error = self._save_results.get_nowait()
+            except queue.Empty:
+                return ok
+            self._pending_saves -= 1
+            if error is not None:
+                ok = False
+                text = self._texts.get(tab_id)
+                if text is not None:
+                    text.edit_modified(True)
+                self.status.config(text=f"Save failed: {fname}")
+                messagebox.showerror("Save", f"Could not save {fname}:\n{error}")
+                continue
+            self.status.config(text=f"Saved {fname}")
+
     def save_as(self) -> None:
-        text = self._current_text()
+        tab_id = self.notebook.select()
+        text = self._texts[tab_id]
         path = filedialog.asksaveasfilename(initialdir=DATA_DIR, defaultextension=".txt")
         if not path:
             return
         text.filename = os.path.basename(path)
-        self.save()
+        self._save_text(tab_id)
 
     def open_file(self) -> None:
         path = filedialog.askopenfilename(initialdir=DATA_DIR, filetypes=[("Text", "*.txt")])
@@ -144,35 +246,43 @@ class GUINotator(tk.Tk):
         haiku = [simpledialog.askstring("Haiku", f"Line {i+1}") for i in range(3)]
         if not all(haiku):
             return
-        counts = [len(line.split()) for line in haiku]
-        if counts != [5, 7, 5]:
+        if any(len(line.split()) != n for line, n in zip(haiku, _HAIKU_WORDS)):
             messagebox.showerror("Haiku", "Haiku must be 5,7,5 words")
             return
         os.remove(os.path.join(DATA_DIR, text.filename))
         self.close_tab()
         self.status.config(text="File deleted")
 
-    def _update_tab_title(self, text: NoteText) -> None:
-        idx = self.notebook.index(self.notebook.select())
-        title = text.filename or "Untitled"
-        self.notebook.tab(idx, text=title)
+    def _update_tab_title(self, tab_id: str) -> None:
+        title = self._texts[tab_id].filename or "Untitled"
+        self.notebook.tab(tab_id, text=title)
 
     # ---------- Timer ----------
     def set_timer(self) -> None:
         minutes = simpledialog.askinteger("Timer", "Minutes:", minvalue=1, maxvalue=120)
         if not minutes:
             return
-        self.remaining = minutes * 60
+        if self.timer_id:
+            self.after_cancel(self.timer_id)
+        self._deadline = time.monotonic() + minutes * 60
         self._tick_timer()
 
     def _tick_timer(self) -> None:
-        mins, sec = divmod(self.remaining, 60)
-        self.timer_label.config(text=f"{mins:02d}:{sec:02d}")
+        left = max(0.0, self._deadline - time.monotonic())
+        self.remaining = math.ceil(left)
+        if self.remaining < 60:
+            label = _LAST_MINUTE_LABELS[self.remaining]
+        else:
+            mins, sec = divmod(self.remaining, 60)
+            label = f"{mins:02d}:{sec:02d}"
+        self.timer_label.config(text=label)
         if self.remaining <= 0:
+            self.timer_id = None
             self.status.config(text="Timer finished")
             return
-        self.remaining -= 1
-        self.timer_id = self.after(1000, self._tick_timer)
+        # Wake just after the next whole-second boundary of the deadline.
+        delay = int(left * 1000) % 1000 + 1
+        self.timer_id = self.after(delay, self._tick_timer)
 
     def reset_timer(self) -> None:
         if self.timer_id:
@@ -185,46 +295,68 @@ class GUINotator(tk.Tk):
     def show_quote(self) -> None:
         if not self.quotes:
             return
-        quote = random.choice(self.quotes)
-        messagebox.showinfo("Quote", quote)
+        if self._quote_win is None:
+            # Non-modal and reused, so the timer and other tabs keep running.
+            self._quote_win = tk.Toplevel(self)
+            self._quote_win.title("Quote")
+            self._quote_win.protocol("WM_DELETE_WINDOW", self._quote_win.withdraw)
+            self._quote_label = tk.Label(self._quote_win, wraplength=400, padx=10, pady=10)
+            self._quote_label.pack(fill=tk.BOTH, expand=True)
+        self._quote_label.config(text=self.quotes[random.randrange(len(self.quotes))])
+        self._quote_win.deiconify()
+        self._quote_win.lift()
 
     # ---------- Hemingway mode ----------
     def toggle_hemingway(self) -> None:
         self.hemingway = not self.hemingway
-        text = self._current_text()
-        text.enable_hemingway(self.hemingway)
+        for text in self._texts.values():
+            text.enable_hemingway(self.hemingway)
         state = "on" if self.hemingway else "off"
         self.status.config(text=f"Hemingway mode {state}")
 
     # ---------- Startup/shutdown ----------
     def _load_tabs(self) -> None:
-        if os.path.exists(STATE_FILE):
-            try:
-                with open(STATE_FILE, "r", encoding="utf-8") as f:
-                    files = json.load(f)
-            except Exception:
-                files = []
-        else:
+        try:
+            with open(STATE_FILE, "r", encoding="utf-8") as f:
+                files = json.load(f)
+        except (OSError, ValueError):
+            files = []
+        if not isinstance(files, list):
             files = []
-        for fname in files:
-            path = os.path.join(DATA_DIR, fname)
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.new_tab(fname, content)
+        files = [
+            fname for fname in files
+            if isinstance(fname, str) and os.path.exists(os.path.join(DATA_DIR, fname))
+        ]
+        if files:
+            # Read the files concurrently; only widget creation runs on the Tk thread.
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                for fname, content in pool.map(self._read_note, files):
+                    self.new_tab(fname, content)
         if not self.notebook.tabs():
             self.new_tab()
 
+    @staticmethod
+    def _read_note(fname: str) -> tuple[str, str]:
+        with open(os.path.join(DATA_DIR, fname), "r", encoding="utf-8") as f:
+            return fname, f.read()
+
     def on_close(self) -> None:
-        files = []
-        for tab_id in self.notebook.tabs():
-            frame = self.nametowidget(tab_id)
-            text = frame.winfo_children()[0]
-            if text.filename:
-                files.append(text.filename)
+        if self._saver is not None:
+            # Let queued writes finish; stay open if any of them failed.
+            self._save_queue.put(None)
+            self._saver.join()
+            self._saver = None
+            if not self._drain_saves():
+                return
+        files = [text.filename for text in self._texts.values() if text.filename]
         os.makedirs(DATA_DIR, exist_ok=True)
-        with open(STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(files, f)
+        # Write next to the target and rename so a crash never leaves a partial file.
+        tmp = STATE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(files, separators=(",", ":")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, STATE_FILE)
         self.destroy()
 
 